@@ -24,6 +24,12 @@ function lintJsonFile(filePath) {
     console.log(`${COLORS.green}✓${COLORS.reset} ${filePath}`);
     return true;
   } catch (e) {
+    if (e.code === 'ENOENT') {
+      // Deleted/renamed files passed by lint-staged are skipped, same as
+      // the old existsSync guard, but without the extra stat or the race
+      // between check and read.
+      return true;
+    }
     console.log(`${COLORS.red}✗${COLORS.reset} ${filePath}`);
     console.log(`  ${e.message}`);
     return false;
@@ -38,7 +44,7 @@ if (args.length === 0) {
 console.log('\nLinting JSON files...\n');
 
 for (const file of args) {
-  if (fs.existsSync(file) && file.endsWith('.json')) {
+  if (file.endsWith('.json')) {
     if (!lintJsonFile(file)) {
       hasErrors = true;
     }
@@ -31,6 +31,8 @@ const log = {
   header: (msg) => console.log(`\n${COLORS.cyan}${COLORS.bold}${msg}${COLORS.reset}`),
 };
 
+const PLUGIN_NAME_REGEX = /^[a-z][a-z0-9-]*$/;
+
 const rl = readline.createInterface({
   input: process.stdin,
   output: process.stdout,
@@ -184,7 +186,7 @@ When the user invokes this command:
  */
 function createExampleSkill(pluginPath, config) {
   const skillDir = path.join(pluginPath, 'skills', `${config.name}-skill`);
-  fs.mkdirSync(skillDir, { recursive: true });
+  fs.mkdirSync(skillDir);
 
   const content = `# ${config.name} Skill
 
@@ -318,7 +320,7 @@ async function interactive() {
 
   // Get plugin name
   const name = await question('Plugin name (kebab-case): ');
-  if (!name || !/^[a-z][a-z0-9-]*$/.test(name)) {
+  if (!name || !PLUGIN_NAME_REGEX.test(name)) {
     log.error('Invalid plugin name. Use kebab-case (e.g., my-plugin)');
     rl.close();
     process.exit(1);
@@ -370,8 +372,9 @@ async function interactive() {
   if (hasHooks) dirs.push('hooks');
   if (hasAgents) dirs.push('agents');
 
+  fs.mkdirSync(pluginPath, { recursive: true });
   for (const dir of dirs) {
-    fs.mkdirSync(path.join(pluginPath, dir), { recursive: true });
+    fs.mkdirSync(path.join(pluginPath, dir));
   }
   log.success(`Created plugin directory: plugins/${name}/`);
 
@@ -426,7 +429,7 @@ Next steps:
  * Quick create (non-interactive)
  */
 function quickCreate(name, description) {
-  if (!name || !/^[a-z][a-z0-9-]*$/.test(name)) {
+  if (!name || !PLUGIN_NAME_REGEX.test(name)) {
     log.error('Invalid plugin name. Use kebab-case (e.g., my-plugin)');
     process.exit(1);
   }
@@ -449,9 +452,10 @@ function quickCreate(name, description) {
   };
 
   // Create all directories
+  fs.mkdirSync(pluginPath, { recursive: true });
   const dirs = ['.claude-plugin', 'commands', 'skills', 'hooks', 'agents'];
   for (const dir of dirs) {
-    fs.mkdirSync(path.join(pluginPath, dir), { recursive: true });
+    fs.mkdirSync(path.join(pluginPath, dir));
   }
 
   // Create all files
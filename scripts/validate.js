@@ -32,23 +32,35 @@ const log = {
 let errors = [];
 let warnings = [];
 
+const REQUIRED_MARKETPLACE_FIELDS = ['name', 'owner', 'metadata', 'plugins'];
+const REQUIRED_PLUGIN_FIELDS = ['name', 'version', 'description'];
+const PLUGIN_COMPONENTS = ['commands', 'skills', 'hooks', 'agents'];
+const VALID_HOOK_EVENTS = new Set(['SessionStart', 'PreToolUse', 'PostToolUse', 'Stop']);
+
+const DIVIDER = `${COLORS.cyan}${'═'.repeat(43)}${COLORS.reset}`;
+
+const SEMVER_REGEX = /^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$/;
+
 /**
  * Validate semantic version format
  */
 function isValidSemver(version) {
-  const semverRegex = /^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$/;
-  return semverRegex.test(version);
+  return SEMVER_REGEX.test(version);
 }
 
 /**
  * Validate JSON file syntax
+ * Reads directly instead of stat'ing first; a missing file is reported
+ * via `missing` so callers can distinguish "not found" from "invalid".
  */
 function validateJson(filePath) {
   try {
     const content = fs.readFileSync(filePath, 'utf-8');
-    JSON.parse(content);
     return { valid: true, data: JSON.parse(content) };
   } catch (e) {
+    if (e.code === 'ENOENT') {
+      return { valid: false, missing: true };
+    }
     return { valid: false, error: e.message };
   }
 }
@@ -61,13 +73,12 @@ function validateMarketplace() {
 
   const marketplacePath = path.join(ROOT_DIR, '.claude-plugin', 'marketplace.json');
 
-  if (!fs.existsSync(marketplacePath)) {
+  const result = validateJson(marketplacePath);
+  if (result.missing) {
     errors.push('marketplace.json not found at .claude-plugin/marketplace.json');
     log.error('marketplace.json not found');
     return null;
   }
-
-  const result = validateJson(marketplacePath);
   if (!result.valid) {
     errors.push(`marketplace.json is invalid JSON: ${result.error}`);
     log.error(`Invalid JSON: ${result.error}`);
@@ -77,8 +88,7 @@ function validateMarketplace() {
   const marketplace = result.data;
 
   // Required fields
-  const requiredFields = ['name', 'owner', 'metadata', 'plugins'];
-  for (const field of requiredFields) {
+  for (const field of REQUIRED_MARKETPLACE_FIELDS) {
     if (!marketplace[field]) {
       errors.push(`marketplace.json missing required field: ${field}`);
       log.error(`Missing required field: ${field}`);
@@ -145,13 +155,12 @@ function validatePlugin(pluginDir, pluginName) {
 
   // Check plugin.json
   const pluginJsonPath = path.join(pluginPath, '.claude-plugin', 'plugin.json');
-  if (!fs.existsSync(pluginJsonPath)) {
+  const result = validateJson(pluginJsonPath);
+  if (result.missing) {
     errors.push(`${pluginName}: plugin.json not found`);
     log.error('plugin.json not found at .claude-plugin/plugin.json');
     return false;
   }
-
-  const result = validateJson(pluginJsonPath);
   if (!result.valid) {
     errors.push(`${pluginName}: plugin.json is invalid JSON: ${result.error}`);
     log.error(`plugin.json is invalid JSON: ${result.error}`);
@@ -161,8 +170,7 @@ function validatePlugin(pluginDir, pluginName) {
   const pluginJson = result.data;
 
   // Required plugin.json fields
-  const requiredPluginFields = ['name', 'version', 'description'];
-  for (const field of requiredPluginFields) {
+  for (const field of REQUIRED_PLUGIN_FIELDS) {
     if (!pluginJson[field]) {
       errors.push(`${pluginName}: plugin.json missing required field: ${field}`);
       log.error(`Missing required field: ${field}`);
@@ -182,8 +190,7 @@ function validatePlugin(pluginDir, pluginName) {
   log.success('plugin.json is valid');
 
   // Check component directories
-  const components = ['commands', 'skills', 'hooks', 'agents'];
-  for (const component of components) {
+  for (const component of PLUGIN_COMPONENTS) {
     const componentPath = path.join(pluginPath, component);
     if (fs.existsSync(componentPath)) {
       const files = fs.readdirSync(componentPath);
@@ -209,10 +216,9 @@ function validatePlugin(pluginDir, pluginName) {
     log.warn('README.md is recommended');
   }
 
-  // Check for MCP config
-  const mcpPath = path.join(pluginPath, '.mcp.json');
-  if (fs.existsSync(mcpPath)) {
-    const mcpResult = validateJson(mcpPath);
+  // Check for MCP config (optional; skip silently when absent)
+  const mcpResult = validateJson(path.join(pluginPath, '.mcp.json'));
+  if (!mcpResult.missing) {
     if (mcpResult.valid) {
       log.success('.mcp.json is valid');
     } else {
@@ -228,30 +234,29 @@ function validatePlugin(pluginDir, pluginName) {
  * Validate hooks configuration
  */
 function validateHooks(hooksDir, pluginName) {
-  const hooksJsonPath = path.join(hooksDir, 'hooks.json');
-  if (fs.existsSync(hooksJsonPath)) {
-    const result = validateJson(hooksJsonPath);
-    if (!result.valid) {
-      errors.push(`${pluginName}: hooks/hooks.json is invalid JSON`);
-      log.error('hooks.json is invalid JSON');
-      return;
-    }
+  const result = validateJson(path.join(hooksDir, 'hooks.json'));
+  if (result.missing) {
+    return;
+  }
+  if (!result.valid) {
+    errors.push(`${pluginName}: hooks/hooks.json is invalid JSON`);
+    log.error('hooks.json is invalid JSON');
+    return;
+  }
 
-    const hooks = result.data.hooks || [];
-    const validEvents = ['SessionStart', 'PreToolUse', 'PostToolUse', 'Stop'];
+  const hooks = result.data.hooks || [];
 
-    for (const hook of hooks) {
-      if (!hook.name) {
-        warnings.push(`${pluginName}: hook missing name`);
-      }
-      if (!hook.event) {
-        errors.push(`${pluginName}: hook "${hook.name || 'unknown'}" missing event`);
-      } else if (!validEvents.includes(hook.event)) {
-        warnings.push(`${pluginName}: hook "${hook.name}" has unknown event: ${hook.event}`);
-      }
-      if (!hook.command) {
-        errors.push(`${pluginName}: hook "${hook.name || 'unknown'}" missing command`);
-      }
+  for (const hook of hooks) {
+    if (!hook.name) {
+      warnings.push(`${pluginName}: hook missing name`);
+    }
+    if (!hook.event) {
+      errors.push(`${pluginName}: hook "${hook.name || 'unknown'}" missing event`);
+    } else if (!VALID_HOOK_EVENTS.has(hook.event)) {
+      warnings.push(`${pluginName}: hook "${hook.name}" has unknown event: ${hook.event}`);
+    }
+    if (!hook.command) {
+      errors.push(`${pluginName}: hook "${hook.name || 'unknown'}" missing command`);
     }
   }
 }
@@ -281,9 +286,7 @@ function main() {
   const pluginsOnly = args.includes('--plugins-only');
   const staged = args.includes('--staged');
 
-  console.log(`\n${COLORS.cyan}═══════════════════════════════════════════${COLORS.reset}`);
-  console.log(`${COLORS.cyan}   Claude Marketplace Plugin Validator${COLORS.reset}`);
-  console.log(`${COLORS.cyan}═══════════════════════════════════════════${COLORS.reset}`);
+  console.log(`\n${DIVIDER}\n${COLORS.cyan}   Claude Marketplace Plugin Validator${COLORS.reset}\n${DIVIDER}`);
 
   let marketplace = null;
 
@@ -311,18 +314,16 @@ function main() {
   }
 
   // Summary
-  console.log(`\n${COLORS.cyan}═══════════════════════════════════════════${COLORS.reset}`);
-  console.log(`${COLORS.cyan}   Validation Summary${COLORS.reset}`);
-  console.log(`${COLORS.cyan}═══════════════════════════════════════════${COLORS.reset}\n`);
+  console.log(`\n${DIVIDER}\n${COLORS.cyan}   Validation Summary${COLORS.reset}\n${DIVIDER}\n`);
 
   if (warnings.length > 0) {
     log.warn(`${warnings.length} warning(s)`);
-    warnings.forEach(w => console.log(`   - ${w}`));
+    console.log(warnings.map(w => `   - ${w}`).join('\n'));
   }
 
   if (errors.length > 0) {
     log.error(`${errors.length} error(s)`);
-    errors.forEach(e => console.log(`   - ${e}`));
+    console.log(errors.map(e => `   - ${e}`).join('\n'));
     console.log('');
     process.exit(1);
   }
@@ -31,11 +31,13 @@ const log = {
   header: (msg) => console.log(`\n${COLORS.cyan}${COLORS.bold}${msg}${COLORS.reset}`),
 };
 
+const VERSION_REGEX = /^(\d+)\.(\d+)\.(\d+)(-(.+))?$/;
+
 /**
  * Parse semantic version
  */
 function parseVersion(version) {
-  const match = version.match(/^(\d+)\.(\d+)\.(\d+)(-(.+))?$/);
+  const match = version.match(VERSION_REGEX);
   if (!match) return null;
   return {
     major: parseInt(match[1]),
@@ -64,14 +66,18 @@ function bumpVersion(version, type) {
   }
 }
 
+let pluginsCache = null;
+
 /**
- * Get all plugins
+ * Get all plugins (cached per run; invalidated when a manifest is rewritten)
  */
 function getPlugins() {
+  if (pluginsCache) return pluginsCache;
+
   const pluginsDir = path.join(ROOT_DIR, 'plugins');
   if (!fs.existsSync(pluginsDir)) return [];
 
-  return fs.readdirSync(pluginsDir, { withFileTypes: true })
+  pluginsCache = fs.readdirSync(pluginsDir, { withFileTypes: true })
     .filter(d => d.isDirectory())
     .map(d => {
       const pluginJsonPath = path.join(pluginsDir, d.name, '.claude-plugin', 'plugin.json');
@@ -91,6 +97,8 @@ function getPlugins() {
       }
     })
     .filter(Boolean);
+
+  return pluginsCache;
 }
 
 /**
@@ -186,6 +194,7 @@ async function bumpPluginVersion(pluginName, type, changes) {
   // Update plugin.json
   plugin.data.version = newVersion;
   fs.writeFileSync(plugin.jsonPath, JSON.stringify(plugin.data, null, 2) + '\n');
+  pluginsCache = null;
   log.success(`Updated ${plugin.name} version: ${plugin.version} → ${newVersion}`);
 
   // Update changelog